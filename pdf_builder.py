@@ -0,0 +1,98 @@
+# pdf_builder.py
+# Condition report PDF rendering (ReportLab), kept free of Streamlit so it
+# can run in worker processes and batch jobs. UI lives in condition_report.py.
+
+import datetime as dt
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+# --- Minimal PDF generator (placeholder content for now) ---
+@functools.lru_cache(maxsize=None)
+def _pdf_styles() -> dict:
+    """
+    Paragraph and table styles for the PDF, built once per process.
+    ReportLab styles are not mutated by doc.build(), so they are safe to share.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.units import mm
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    # Only H1/Body are used, so skip building the full getSampleStyleSheet()
+    return {
+        "H1": ParagraphStyle(name="H1", fontName="Helvetica-Bold", fontSize=18, leading=22, spaceAfter=6 * mm),
+        "Body": ParagraphStyle(name="Body", fontName="Helvetica", fontSize=11, leading=16),
+        "fields_table": TableStyle(
+            [
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+                ("FONTSIZE", (0, 0), (-1, -1), 10.5),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ]
+        ),
+        "notes_table": TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black), ("FONTSIZE", (0, 0), (-1, -1), 10.5)]),
+    }
+
+
+def build_pdf_bytes(delivery_date: dt.date) -> bytes:
+    """
+    Create a simple one-page PDF for the selected delivery date.
+    Replace/extend this function later when wiring HubSpot data.
+    """
+    # Lazy import so the Streamlit page loads fast
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Table
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=15 * mm,
+        rightMargin=15 * mm,
+        topMargin=15 * mm,
+        bottomMargin=15 * mm,
+    )
+
+    styles = _pdf_styles()
+
+    story = []
+    story.append(Paragraph("CARS24 Condition Report", styles["H1"]))
+    story.append(Paragraph(f"Delivery date: {delivery_date.isoformat()}", styles["Body"]))
+
+    # Placeholder table for future HubSpot-driven fields
+    data = [
+        ["Field", "Value"],
+        ["Customer Name", "—"],
+        ["Registration", "—"],
+        ["Odometer Reading", "—"],
+        ["Sale ID", "—"],
+    ]
+    # Gaps around the table ride on the flowable instead of separate Spacers
+    t = Table(data, colWidths=[50 * mm, 110 * mm], spaceBefore=6 * mm, spaceAfter=10 * mm)
+    t.setStyle(styles["fields_table"])
+    story.append(t)
+
+    story.append(Paragraph("Notes", styles["Body"]))
+    notes = Table([["—"]], colWidths=[160 * mm])
+    notes.setStyle(styles["notes_table"])
+    story.append(notes)
+
+    doc.build(story)
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+    return pdf_bytes
+
+
+def build_pdfs_bulk(dates: list[dt.date], max_workers: int | None = None) -> dict[dt.date, bytes]:
+    """
+    Render one PDF per delivery date across CPU cores (e.g. a daily batch export).
+    ReportLab is pure Python and GIL-bound, so this fans out to processes, not threads.
+    """
+    dates = list(dates)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return dict(zip(dates, pool.map(build_pdf_bytes, dates, chunksize=8)))